@@ -0,0 +1,58 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled version of the per-test argument loop in main.py.
+
+Build in place with `cythonize -i _fuzzgen.pyx`; main.py falls back to the
+pure-Python implementation when this extension is not available.
+
+Only the argument-assembly loop lives here. Fixed-parameter values are
+drawn in per-parameter batches by generate_fuzz_inputs in main.py, either
+through NumPy or through random.Random methods that already run in C, so a
+compiled per-value generate_fuzz_input would add another copy to keep in
+sync without removing interpreter work from the hot loop.
+"""
+import string
+
+# Must match the KIND_* codes in main.py, which checks KIND_CODES on import
+# and falls back to its pure-Python loop on a mismatch
+cdef enum:
+    KIND_VAR_POSITIONAL = 0
+    KIND_VAR_KEYWORD = 1
+    KIND_KEYWORD_ONLY = 2
+    KIND_POSITIONAL = 3
+
+KIND_CODES = (KIND_VAR_POSITIONAL, KIND_VAR_KEYWORD, KIND_KEYWORD_ONLY, KIND_POSITIONAL)
+
+cdef str LOWER = string.ascii_lowercase
+
+
+def generate_calls(list names, list kinds, list columns, Py_ssize_t num_tests, int string_length, tuple int_range, rng):
+    """
+    Builds the positional and keyword arguments for each of num_tests calls.
+    """
+    cdef object randint = rng.randint, choices = rng.choices
+    cdef object int_min = int_range[0], int_max = int_range[1]
+    cdef Py_ssize_t i, j, n, num_params = len(names)
+    cdef int kind
+    cdef list calls = [], args, column
+    cdef dict kwargs
+
+    for i in range(num_tests):
+        args = []
+        kwargs = {}
+        for j in range(num_params):
+            kind = kinds[j]
+            if kind == KIND_VAR_POSITIONAL:
+                for n in range(randint(0, 3)):
+                    args.append(randint(int_min, int_max))
+            elif kind == KIND_VAR_KEYWORD:
+                for n in range(randint(0, 3)):
+                    kwargs[''.join(choices(LOWER, k=5))] = randint(int_min, int_max)
+            else:
+                column = columns[j]
+                if kind == KIND_KEYWORD_ONLY:
+                    kwargs[names[j]] = column[i]
+                else:
+                    args.append(column[i])
+        calls.append((args, kwargs))
+    return calls
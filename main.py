@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 import argparse
+import importlib.util
 import inspect
 import logging
 import os
 import sys
 import random
 import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the random module
+    np = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -14,6 +22,51 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 DEFAULT_NUM_TESTS = 10
 DEFAULT_STRING_LENGTH = 10
 DEFAULT_INT_RANGE = (-100, 100)
+WRITE_CHUNK_SIZE = 1 << 20  # Bytes per os.write when emitting tests
+PARALLEL_MIN_TESTS = 20000  # Total test cases below which generation stays in-process
+
+# Character pools for random strings and **kwargs keys
+_LETTERS = string.ascii_letters
+_LOWER = string.ascii_lowercase
+# Maps each byte value to a letter, so random bytes translate straight into a string
+_LETTER_TABLE = (_LETTERS * 5)[:256].encode('ascii')
+_LETTER_CODES = np.frombuffer(_LETTERS.encode('ascii'), dtype=np.uint8) if np is not None else None
+# Types generate_fuzz_inputs can draw in bulk with NumPy
+_NP_TYPES = (int, float, str, bool)
+# Bounds NumPy's int64 sampler can handle; wider int ranges use rng.randint
+_NP_INT_MIN, _NP_INT_MAX = (int(np.iinfo(np.int64).min), int(np.iinfo(np.int64).max)) if np is not None else (0, -1)
+
+# Formatters for the value types the generators produce, used instead of repr()
+_STR_ESCAPE = str.maketrans({"\\": "\\\\", "'": "\\'", "\n": "\\n", "\r": "\\r"})
+_REPR = {
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: bool.__repr__,
+    str: lambda value: "'" + value.translate(_STR_ESCAPE) + "'",
+    type(None): lambda value: 'None',
+}
+
+# Template for a single generated test case
+_TMPL = (
+    "# Test case {i} for function: {name}\n"
+    "# Call: {call}\n"
+    "try:\n"
+    "    result = {call}\n"
+    "    print(f'Function {name} executed successfully. Result: {{result}}')\n"
+    "except Exception as e:\n"
+    "    print(f'Function {name} raised an exception: {{e}}')\n\n"
+)
+
+# Small integer codes for parameter kinds, resolved once per function
+KIND_VAR_POSITIONAL = 0
+KIND_VAR_KEYWORD = 1
+KIND_KEYWORD_ONLY = 2
+KIND_POSITIONAL = 3
+_KIND_CODES = {
+    inspect.Parameter.VAR_POSITIONAL: KIND_VAR_POSITIONAL,
+    inspect.Parameter.VAR_KEYWORD: KIND_VAR_KEYWORD,
+    inspect.Parameter.KEYWORD_ONLY: KIND_KEYWORD_ONLY,
+}
 
 
 def setup_argparse():
@@ -66,109 +119,295 @@ def setup_argparse():
     return parser
 
 
-def generate_fuzz_input(param_type, string_length=DEFAULT_STRING_LENGTH, int_range=DEFAULT_INT_RANGE):
+@lru_cache(maxsize=None)
+def _cached_signature(func):
+    """
+    Returns the signature of a function, caching the result so aliased or
+    repeatedly inspected functions are only introspected once.
+    """
+    sig = getattr(func, "__signature__", None)
+    if isinstance(sig, inspect.Signature):
+        return sig
+    return inspect.signature(func)
+
+
+def _gen_int(rng, string_length, int_range):
+    return rng.randint(int_range[0], int_range[1])
+
+
+def _gen_float(rng, string_length, int_range):
+    return rng.uniform(int_range[0], int_range[1])
+
+
+def _gen_str(rng, string_length, int_range):
+    # getrandbits rather than randbytes, which needs Python 3.9+
+    return rng.getrandbits(8 * string_length).to_bytes(string_length, 'little').translate(_LETTER_TABLE).decode('ascii')
+
+
+def _gen_bool(rng, string_length, int_range):
+    return rng.choice([True, False])
+
+
+def _gen_none(rng, string_length, int_range):
+    return None
+
+
+# Input generators keyed by parameter type
+_GEN = {
+    int: _gen_int,
+    float: _gen_float,
+    str: _gen_str,
+    bool: _gen_bool,
+    type(None): _gen_none,
+}
+
+
+def generate_fuzz_input(param_type, string_length=DEFAULT_STRING_LENGTH, int_range=DEFAULT_INT_RANGE, rng=random):
     """
     Generates a random input based on the specified parameter type.
     Supports int, float, str, bool, and None. Other types return None.
+    Values are drawn from rng, a random.Random instance or the random module.
+    Errors propagate to the caller, which logs them per function.
     """
     try:
+        gen = _GEN.get(param_type)
+    except TypeError:  # Unhashable annotation, e.g. a list literal
+        gen = None
+    if gen is None:
+        logging.warning("Unsupported parameter type: %s. Returning None.", param_type)
+        return None  # Unsupported type
+    return gen(rng, string_length, int_range)
+
+
+def generate_fuzz_inputs(param_type, count, string_length=DEFAULT_STRING_LENGTH, int_range=DEFAULT_INT_RANGE, rng=random):
+    """
+    Generates a batch of random inputs for the specified parameter type.
+    Uses NumPy to draw the whole batch in one call when it is available,
+    with a NumPy generator seeded from rng so all values derive from rng.
+    """
+    if np is not None and param_type in _NP_TYPES:
+        np_rng = np.random.default_rng(rng.getrandbits(64))
         if param_type is int:
-            return random.randint(int_range[0], int_range[1])
+            if _NP_INT_MIN <= int_range[0] and int_range[1] <= _NP_INT_MAX:
+                return np_rng.integers(int_range[0], int_range[1], size=count, dtype=np.int64, endpoint=True).tolist()
         elif param_type is float:
-            return random.uniform(int_range[0], int_range[1])
+            return np_rng.uniform(int_range[0], int_range[1], size=count).tolist()
         elif param_type is str:
-            return ''.join(random.choice(string.ascii_letters) for _ in range(string_length))
+            indices = np_rng.integers(0, len(_LETTERS), size=(count, string_length))
+            chars = _LETTER_CODES[indices].tobytes().decode('ascii')
+            return [chars[j:j + string_length] for j in range(0, count * string_length, string_length)]
         elif param_type is bool:
-            return random.choice([True, False])
-        elif param_type is type(None):
-            return None
-        else:
-            logging.warning(f"Unsupported parameter type: {param_type}. Returning None.")
-            return None  # Unsupported type
+            return np_rng.integers(0, 2, size=count).astype(bool).tolist()
+    return [generate_fuzz_input(param_type, string_length, int_range, rng) for _ in range(count)]
+
+
+@lru_cache(maxsize=None)
+def _make_generator(names, kinds):
+    """
+    Compiles a call-argument generator specialized to one signature shape.
+    The generated loop has no per-parameter branching; results are cached
+    by the (names, kinds) tuples so identical signatures share one function.
+    """
+    positional = [f"c{idx}[i]" for idx, kind in enumerate(kinds) if kind == KIND_POSITIONAL]
+    keyword = [f"{names[idx]!r}: c{idx}[i]" for idx, kind in enumerate(kinds) if kind == KIND_KEYWORD_ONLY]
+    lines = ["def generate(columns, num_tests, int_min, int_max, randint, choices):"]
+    lines += [f"    c{idx} = columns[{idx}]" for idx, kind in enumerate(kinds) if kind >= KIND_KEYWORD_ONLY]
+    lines += [
+        "    calls = []",
+        "    for i in range(num_tests):",
+        f"        args = [{', '.join(positional)}]",
+    ]
+    if KIND_VAR_POSITIONAL in kinds:
+        lines.append("        args.extend([randint(int_min, int_max) for _ in range(randint(0, 3))])")
+    lines.append(f"        kwargs = {{{', '.join(keyword)}}}")
+    if KIND_VAR_KEYWORD in kinds:
+        lines += [
+            "        for _ in range(randint(0, 3)):",
+            "            kwargs[''.join(choices(LOWER, k=5))] = randint(int_min, int_max)",
+        ]
+    lines += [
+        "        calls.append((args, kwargs))",
+        "    return calls",
+    ]
+    namespace = {"LOWER": _LOWER}
+    exec("\n".join(lines), namespace)
+    return namespace["generate"]
+
+
+def _generate_calls_py(names, kinds, columns, num_tests, string_length, int_range, rng):
+    """
+    Builds the positional and keyword arguments for each of num_tests calls.
+    Replaced by the compiled version in _fuzzgen.pyx when it has been built.
+    """
+    generate = _make_generator(tuple(names), tuple(kinds))
+    return generate(columns, num_tests, int_range[0], int_range[1], rng.randint, rng.choices)
+
+
+try:
+    from _fuzzgen import KIND_CODES as _FUZZGEN_KIND_CODES, generate_calls as _generate_calls_c
+except ImportError:  # Extension not built; use the pure-Python loop above
+    _generate_calls = _generate_calls_py
+else:
+    if _FUZZGEN_KIND_CODES == (KIND_VAR_POSITIONAL, KIND_VAR_KEYWORD, KIND_KEYWORD_ONLY, KIND_POSITIONAL):
+        _generate_calls = _generate_calls_c
+    else:
+        logging.warning("_fuzzgen kind codes are out of sync with main.py; rebuild _fuzzgen.pyx. Using the pure-Python loop.")
+        _generate_calls = _generate_calls_py
+
+
+# Modules loaded by _import_module, keyed by absolute path
+_MODULE_CACHE = {}
+# Directories _import_module has already added to sys.path
+_MODULE_DIRS = set()
+
+
+def _import_module(module_path):
+    """
+    Imports the module at module_path, caching it by absolute path.
+    Its directory is put on sys.path once so sibling imports resolve.
+    """
+    path = os.path.abspath(module_path)
+    module = _MODULE_CACHE.get(path)
+    if module is not None:
+        return module
+
+    module_dir, module_file = os.path.split(path)
+    module_name, module_ext = os.path.splitext(module_file)
+
+    if module_dir not in _MODULE_DIRS:
+        _MODULE_DIRS.add(module_dir)
+        if module_dir not in sys.path:
+            sys.path.append(module_dir)
+
+    # Load under a private name so the target cannot shadow __main__, this
+    # tool or a stdlib module that happens to share its file name
+    private_name = f"_fuzz_target_{abs(hash(path))}_{module_name}"
+    spec = importlib.util.spec_from_file_location(private_name, path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load module from {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    # Register before executing so the module can look itself up while loading
+    sys.modules[private_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        sys.modules.pop(private_name, None)
+        raise
+    _MODULE_CACHE[path] = module
+    return module
+
+
+def _gen_for_function(name, module_path, num_tests, string_length, int_range):
+    """
+    Generates the fuzz test cases for a single function of the module.
+    The module is looked up by path so this also works in a worker process.
+    """
+    try:
+        obj = getattr(_import_module(module_path), name)
+        sig = _cached_signature(obj)
+        rng = random.Random()
+        # Resolve parameter names, kinds and types once, as parallel lists
+        empty = inspect.Parameter.empty
+        params = sig.parameters.values()
+        names = [param.name for param in params]
+        kinds = [_KIND_CODES.get(param.kind, KIND_POSITIONAL) for param in params]
+        types = [param.annotation if param.annotation is not empty else str for param in params]  # Default to str if no annotation
+        # Draw every fixed parameter's values for all tests in one batch
+        columns = [
+            generate_fuzz_inputs(param_type, num_tests, string_length, int_range, rng)
+            if kind >= KIND_KEYWORD_ONLY else None
+            for param_type, kind in zip(types, kinds)
+        ]
+        test_cases = []
+        for i, (args, kwargs) in enumerate(_generate_calls(names, kinds, columns, num_tests, string_length, int_range, rng)):
+            # Construct the test case string
+            args_str = ", ".join(_REPR.get(type(arg), repr)(arg) for arg in args)
+            kwargs_str = ", ".join(f"{k}={_REPR.get(type(v), repr)(v)}" for k, v in kwargs.items())
+            if args_str and kwargs_str:
+                call_str = f"{obj.__name__}({args_str}, {kwargs_str})"
+            elif args_str:
+                call_str = f"{obj.__name__}({args_str})"
+            elif kwargs_str:
+                call_str = f"{obj.__name__}({kwargs_str})"
+            else:
+                call_str = f"{obj.__name__}()"
+
+            test_cases.append(_TMPL.format(i=i + 1, name=obj.__name__, call=call_str))
+        return test_cases
     except Exception as e:
-        logging.error(f"Error generating fuzz input for type {param_type}: {e}")
-        return None
+        logging.error("Error generating test case for function %s: %s", name, e)
+        return []
 
 
 def generate_fuzz_tests(module_path, num_tests=DEFAULT_NUM_TESTS, string_length=DEFAULT_STRING_LENGTH, int_range=DEFAULT_INT_RANGE):
     """
     Generates fuzz tests for functions in a given module.
+    Large runs are spread across worker processes; test cases are yielded
+    as each function's batch completes.
     """
     try:
         # Dynamically import the module
-        module_dir, module_file = os.path.split(module_path)
-        module_name, module_ext = os.path.splitext(module_file)
-
-        if module_dir not in sys.path:
-            sys.path.append(module_dir)
-
         try:
-            module = __import__(module_name)
+            module = _import_module(module_path)
         except ImportError as e:
-            logging.error(f"Failed to import module {module_name}: {e}")
-            return []
+            logging.error("Failed to import module %s: %s", module_path, e)
+            return
+
+        # Only functions defined in the module itself, skipping imported helpers
+        names = [
+            name for name, obj in vars(module).items()
+            if inspect.isfunction(obj) and getattr(obj, '__module__', None) == module.__name__
+        ]
+        if not names:
+            return
+
+        gen = partial(
+            _gen_for_function,
+            module_path=module_path,
+            num_tests=num_tests,
+            string_length=string_length,
+            int_range=int_range,
+        )
+        workers = min(len(names), os.cpu_count() or 1)
+        # Process startup outweighs the work for small runs
+        if workers <= 1 or len(names) * num_tests < PARALLEL_MIN_TESTS:
+            for name in names:
+                yield from gen(name)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for test_cases in executor.map(gen, names):
+                yield from test_cases
 
+    except Exception as e:
+        logging.error("An unexpected error occurred: %s", e)
 
-        test_cases = []
-        for name, obj in inspect.getmembers(module):
-            if inspect.isfunction(obj):
-                try:
-                    sig = inspect.signature(obj)
-                    params = sig.parameters
-                    for i in range(num_tests):
-                        args = []
-                        kwargs = {}
-                        for param_name, param in params.items():
-                            param_type = param.annotation if param.annotation != inspect.Parameter.empty else str  # Default to str if no annotation
-
-                            # Handle variable positional arguments (*args)
-                            if param.kind == inspect.Parameter.VAR_POSITIONAL:
-                                args.extend([generate_fuzz_input(int, string_length, int_range) for _ in range(random.randint(0, 3))]) # fuzz *args
-                                continue
-                            # Handle variable keyword arguments (**kwargs)
-                            elif param.kind == inspect.Parameter.VAR_KEYWORD:
-                                #Create a dict of random inputs for kwargs. Limiting to 3 for clarity.
-                                kwargs.update({
-                                    ''.join(random.choice(string.ascii_lowercase) for _ in range(5)): generate_fuzz_input(int, string_length, int_range)
-                                    for _ in range(random.randint(0, 3))
-                                })
-                                continue
-                            else:
-                                arg = generate_fuzz_input(param_type, string_length, int_range)
-
-                            if param.kind == inspect.Parameter.KEYWORD_ONLY:
-                                kwargs[param_name] = arg
-                            else:
-                                args.append(arg)
-
-                        # Construct the test case string
-                        args_str = ", ".join(repr(arg) for arg in args)
-                        kwargs_str = ", ".join(f"{k}={repr(v)}" for k, v in kwargs.items())
-                        if args_str and kwargs_str:
-                            call_str = f"{obj.__name__}({args_str}, {kwargs_str})"
-                        elif args_str:
-                            call_str = f"{obj.__name__}({args_str})"
-                        elif kwargs_str:
-                            call_str = f"{obj.__name__}({kwargs_str})"
-                        else:
-                            call_str = f"{obj.__name__}()"
-
-                        test_case = f"# Test case {i+1} for function: {obj.__name__}\n"
-                        test_case += f"# Call: {call_str}\n"
-                        test_case += f"try:\n"
-                        test_case += f"    result = {call_str}\n"
-                        test_case += f"    print(f'Function {obj.__name__} executed successfully. Result: {{result}}')\n"
-                        test_case += f"except Exception as e:\n"
-                        test_case += f"    print(f'Function {obj.__name__} raised an exception: {{e}}')\n\n"
-                        test_cases.append(test_case)
-                except Exception as e:
-                    logging.error(f"Error generating test case for function {name}: {e}")
+def _write_all(fd, data):
+    """
+    Writes all of data to the file descriptor, retrying short writes.
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
-        return test_cases
 
-    except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
-        return []
+def _write_chunked(fd, parts):
+    """
+    Encodes the strings from parts and writes them to the file descriptor
+    in blocks of roughly WRITE_CHUNK_SIZE bytes.
+    """
+    pending = []
+    pending_size = 0
+    for part in parts:
+        pending.append(part)
+        pending_size += len(part)
+        if pending_size >= WRITE_CHUNK_SIZE:
+            _write_all(fd, "".join(pending).encode('utf-8'))
+            pending = []
+            pending_size = 0
+    if pending:
+        _write_all(fd, "".join(pending).encode('utf-8'))
+
 
 def main():
     """
@@ -179,7 +418,7 @@ def main():
 
     # Input validation
     if not os.path.exists(args.module_path):
-        logging.error(f"Module path does not exist: {args.module_path}")
+        logging.error("Module path does not exist: %s", args.module_path)
         sys.exit(1)
 
     if args.num_tests <= 0:
@@ -204,16 +443,17 @@ def main():
 
     if args.output_file:
         try:
-            with open(args.output_file, "w") as f:
-                for test_case in tests:
-                    f.write(test_case)
-            logging.info(f"Fuzz tests saved to: {args.output_file}")
+            fd = os.open(args.output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                _write_chunked(fd, tests)
+            finally:
+                os.close(fd)
+            logging.info("Fuzz tests saved to: %s", args.output_file)
         except Exception as e:
-            logging.error(f"Error writing to output file: {e}")
+            logging.error("Error writing to output file: %s", e)
             sys.exit(1)
     else:
-        for test_case in tests:
-            print(test_case)
+        sys.stdout.writelines(f"{test_case}\n" for test_case in tests)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,71 @@
+import inspect
+import random
+import string
+
+import pytest
+
+import main
+
+
+def _mixed(a: int, b: str, *args, c: bool, d: float, **kwargs):
+    pass
+
+
+def _calls_from_exec(names, kinds, columns, num_tests, int_range, rng):
+    generate = main._make_generator(tuple(names), tuple(kinds))
+    return generate(columns, num_tests, int_range[0], int_range[1], rng.randint, rng.choices)
+
+
+def _calls_from_extension(names, kinds, columns, num_tests, int_range, rng):
+    fuzzgen = pytest.importorskip("_fuzzgen")
+    return fuzzgen.generate_calls(list(names), list(kinds), columns, num_tests, main.DEFAULT_STRING_LENGTH, int_range, rng)
+
+
+def test_extension_kind_codes_match():
+    fuzzgen = pytest.importorskip("_fuzzgen")
+    assert fuzzgen.KIND_CODES == (main.KIND_VAR_POSITIONAL, main.KIND_VAR_KEYWORD, main.KIND_KEYWORD_ONLY, main.KIND_POSITIONAL)
+
+
+@pytest.mark.parametrize("build_calls", [_calls_from_exec, _calls_from_extension])
+def test_call_shape_for_mixed_signature(build_calls):
+    params = inspect.signature(_mixed).parameters.values()
+    names = [param.name for param in params]
+    kinds = [main._KIND_CODES.get(param.kind, main.KIND_POSITIONAL) for param in params]
+    assert kinds == [
+        main.KIND_POSITIONAL,
+        main.KIND_POSITIONAL,
+        main.KIND_VAR_POSITIONAL,
+        main.KIND_KEYWORD_ONLY,
+        main.KIND_KEYWORD_ONLY,
+        main.KIND_VAR_KEYWORD,
+    ]
+
+    num_tests = 50
+    int_range = (-5, 5)
+    columns = [
+        list(range(num_tests)),
+        [f"s{i}" for i in range(num_tests)],
+        None,
+        [i % 2 == 0 for i in range(num_tests)],
+        [i / 2 for i in range(num_tests)],
+        None,
+    ]
+    calls = build_calls(names, kinds, columns, num_tests, int_range, random.Random(0))
+
+    assert len(calls) == num_tests
+    for i, (args, kwargs) in enumerate(calls):
+        # Positional parameters first, then 0-3 extra ints for *args
+        assert args[:2] == [columns[0][i], columns[1][i]]
+        assert 0 <= len(args) - 2 <= 3
+        assert all(int_range[0] <= extra <= int_range[1] for extra in args[2:])
+
+        # Keyword-only parameters first, then 0-3 random keys for **kwargs
+        keys = list(kwargs)
+        assert keys[:2] == ["c", "d"]
+        assert kwargs["c"] == columns[3][i]
+        assert kwargs["d"] == columns[4][i]
+        extra_keys = keys[2:]
+        assert len(extra_keys) <= 3
+        for key in extra_keys:
+            assert len(key) == 5 and set(key) <= set(string.ascii_lowercase)
+            assert int_range[0] <= kwargs[key] <= int_range[1]